@@ -19,19 +19,30 @@ List file format (~/.work_drop.txt):
 """
 from __future__ import annotations
 import argparse
+import ctypes
 import os
+import re
+import select
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
-from commons import log, notify
+from commons import compiled_script, log, notify, read_entries
 
 
 BASE_DIR = Path(__file__).resolve().parent
+QUIT_SCPT = BASE_DIR / "quit.scpt"
+_QUIT_SOURCE = """on run argv
+tell application (item 1 of argv) to quit
+end run"""
 OSASCRIPT = "/usr/bin/osascript"
 PKILL = "/usr/bin/pkill"
 PGREP = "/usr/bin/pgrep"
+PS = "/bin/ps"
 LAUNCHCTL = "/bin/launchctl"
 
 
@@ -59,24 +70,143 @@ def apple_script_quit(app_name: str) -> bool:
     :return: True if AppleScript command issued, False on error
     :rtype: bool
     """
-    script = f'tell application "{app_name}" to quit'
+    compiled = compiled_script(QUIT_SCPT, _QUIT_SOURCE)
     try:
-        run([OSASCRIPT, "-e", script], check=True)
+        if compiled is not None:
+            # pre-compiled script skips AppleScript tokenize/compile on each call
+            run([OSASCRIPT, str(compiled), app_name], check=True)
+        else:
+            run([OSASCRIPT, "-e", f'tell application "{app_name}" to quit'], check=True)
         log(f"AppleScript quit issued to '{app_name}'")
         return True
     except subprocess.CalledProcessError as e:
         log(f"AppleScript quit failed for '{app_name}': {e}")
         return False
 
+@lru_cache(None)
+def _libproc() -> Optional[ctypes.CDLL]:
+    """
+    Load libproc once; None when unavailable (non-macOS).
+
+    :return: libproc handle or None
+    :rtype: ctypes.CDLL or None
+    """
+    try:
+        return ctypes.CDLL("/usr/lib/libproc.dylib")
+    except OSError:
+        return None
+
+
+@lru_cache(None)
+def _libc() -> Optional[ctypes.CDLL]:
+    """
+    Resolve libc symbols (sysctl) from the running process, once.
+
+    :return: libc handle or None
+    :rtype: ctypes.CDLL or None
+    """
+    try:
+        return ctypes.CDLL(None)
+    except OSError:
+        return None
+
+
+_CTL_KERN = 1
+_KERN_PROCARGS2 = 49
+
+
+def _proc_cmdline(libc: ctypes.CDLL, pid: int) -> Optional[str]:
+    """
+    Read a process's full argument vector via sysctl KERN_PROCARGS2.
+
+    The buffer starts with an int argc, then the executable path, NUL
+    padding, and the NUL-separated argv (environment follows, ignored).
+
+    :param libc: handle providing sysctl
+    :type libc: ctypes.CDLL
+    :param pid: process ID
+    :type pid: int
+    :return: space-joined command line, or None when unreadable
+    :rtype: str or None
+    """
+    mib = (ctypes.c_int * 3)(_CTL_KERN, _KERN_PROCARGS2, pid)
+    size = ctypes.c_size_t(0)
+    if libc.sysctl(mib, 3, None, ctypes.byref(size), None, 0) != 0 or size.value < 8:
+        return None
+    buf = ctypes.create_string_buffer(size.value)
+    if libc.sysctl(mib, 3, buf, ctypes.byref(size), None, 0) != 0:
+        return None
+    raw = buf.raw[:size.value]
+    argc = int.from_bytes(raw[:4], sys.byteorder)
+    try:
+        pos = raw.index(b"\x00", 4)  # end of the executable path
+        while pos < len(raw) and raw[pos] == 0:
+            pos += 1
+        args = []
+        for _ in range(argc):
+            end = raw.index(b"\x00", pos)
+            args.append(raw[pos:end])
+            pos = end + 1
+    except ValueError:
+        return None
+    return b" ".join(args).decode(errors="ignore")
+
+
+def _list_pids() -> Optional[List[Tuple[int, str]]]:
+    """
+    Snapshot the process table via libproc — no subprocess needed.
+
+    Each entry carries the full command line (KERN_PROCARGS2) so pattern
+    matching sees the same string pkill/pgrep -f match against; the
+    executable path stands in when the args are unreadable.
+
+    :return: list of (pid, command line) tuples, or None when libproc
+             is unavailable and the pgrep fallback should be used
+    :rtype: List[Tuple[int, str]] or None
+    """
+    libproc = _libproc()
+    libc = _libc()
+    if libproc is None or libc is None:
+        return None
+    try:
+        count = libproc.proc_listallpids(None, 0)
+        if count <= 0:
+            return []
+        buf = (ctypes.c_int * (count + 32))()
+        count = libproc.proc_listallpids(buf, ctypes.sizeof(buf))
+        path_buf = ctypes.create_string_buffer(4096)
+        procs = []
+        for i in range(count):
+            pid = buf[i]
+            if pid <= 0:
+                continue
+            cmd = _proc_cmdline(libc, pid)
+            if cmd is None and libproc.proc_pidpath(pid, path_buf, 4096) > 0:
+                cmd = path_buf.value.decode(errors="ignore")
+            if cmd:
+                procs.append((pid, cmd))
+        return procs
+    except Exception as e:
+        log(f"libproc scan error: {e}")
+        return None
+
+
 def pgrep_pids(pattern: str) -> List[int]:
     """
-    Return list of PIDs matching pattern using pgrep; empty list if none.
+    Return list of PIDs matching pattern; empty list if none.
+
+    Scans the process table directly via libproc (matching on the full
+    command line, as pgrep -f does) when possible; falls back to spawning
+    pgrep -f otherwise.
 
-    :param pattern: pattern to match (for pgrep -f)
+    :param pattern: pattern to match (substring of the command line)
     :type pattern: str
     :return: list of PIDs
     :rtype: List[int]
     """
+    procs = _list_pids()
+    if procs is not None:
+        return [pid for pid, path in procs if pattern in path]
     try:
         res = run([PGREP, "-f", pattern], check=False, capture=True)
         if res.stdout.strip() == "":
@@ -86,25 +216,70 @@ def pgrep_pids(pattern: str) -> List[int]:
         log(f"pgrep error for '{pattern}': {e}")
         return []
 
-def kill_pids(pids: List[int], sig: int = 15) -> None:
+def kill_pattern(pattern: str, sig: int = 15) -> None:
     """
-    Send signal to list of pids.
+    Send signal to all processes matching pattern with a single pkill call.
 
-    :param pids: list of PIDs
-    :type pids: List[int]
+    :param pattern: pattern to match (for pkill -f)
+    :type pattern: str
     :param sig: signal number (default 15=SIGTERM, 9=SIGKILL)
     :type sig: int
     """
-    for pid in pids:
-        try:
-            os.kill(pid, sig)
-            log(f"Sent signal {sig} to PID {pid}")
-        except ProcessLookupError:
-            log(f"PID {pid} not found")
-        except PermissionError:
-            log(f"No permission to signal PID {pid}")
-        except Exception as e:
-            log(f"Error signaling PID {pid}: {e}")
+    try:
+        run([PKILL, f"-{sig}", "-f", pattern], check=False)
+        log(f"pkill -{sig} -f {pattern} issued")
+    except Exception as e:
+        log(f"pkill error (signal {sig}) for '{pattern}': {e}")
+
+def wait_exit(pids: List[int], timeout: float = 2.0) -> None:
+    """
+    Wait until all given PIDs have exited or the timeout expires.
+
+    Uses kqueue EVFILT_PROC/NOTE_EXIT on macOS so the wait unblocks the
+    moment the last process exits instead of sleeping a fixed interval.
+    Falls back to a plain sleep where kqueue is unavailable.
+
+    :param pids: list of PIDs to wait for
+    :type pids: List[int]
+    :param timeout: maximum time to wait in seconds
+    :type timeout: float
+    """
+    if not pids:
+        return
+    if not hasattr(select, "kqueue"):
+        time.sleep(timeout)
+        return
+    try:
+        kq = select.kqueue()
+    except OSError as e:
+        log(f"kqueue unavailable, falling back to sleep: {e}")
+        time.sleep(timeout)
+        return
+    try:
+        # Register one PID at a time — a batched control() raises ESRCH as
+        # soon as any PID has already exited, which would skip the grace
+        # wait for the survivors
+        remaining = 0
+        for pid in pids:
+            event = select.kevent(
+                pid,
+                filter=select.KQ_FILTER_PROC,
+                flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                fflags=select.KQ_NOTE_EXIT,
+            )
+            try:
+                kq.control([event], 0)
+                remaining += 1
+            except OSError:
+                continue  # already exited
+        deadline = time.monotonic() + timeout
+        while remaining > 0:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                break
+            remaining -= len(kq.control([], remaining, left))
+    finally:
+        kq.close()
 
 def force_kill_by_name(name: str) -> None:
     """
@@ -114,17 +289,72 @@ def force_kill_by_name(name: str) -> None:
     :type name: str
     """
     # Try SIGTERM first
-    try:
-        run([PKILL, "-f", name], check=False)
-        log(f"pkill -f {name} (SIGTERM) issued")
-    except Exception as e:
-        log(f"pkill error (SIGTERM) for '{name}': {e}")
+    kill_pattern(name, sig=15)
 
     # wait a moment then SIGKILL remaining
     pids = pgrep_pids(name)
     if pids:
         log(f"PIDs still alive after SIGTERM for '{name}': {pids}; sending SIGKILL")
-        kill_pids(pids, sig=9)
+        kill_pattern(name, sig=9)
+
+LAUNCHD_DIRS = [
+    Path.home() / "Library" / "LaunchAgents",
+    Path("/Library/LaunchAgents"),
+    Path("/Library/LaunchDaemons"),
+    Path("/System/Library/LaunchAgents"),
+    Path("/System/Library/LaunchDaemons"),
+]
+
+
+def _read_dir(d: Path) -> List[Tuple[Path, bytes]]:
+    """
+    Read all plists from one launchd directory.
+
+    :param d: directory to read
+    :type d: Path
+    :return: list of (path, raw contents) tuples
+    :rtype: List[Tuple[Path, bytes]]
+    """
+    entries = []
+    # EAFP: a missing directory raises instead of paying an exists() stat first
+    try:
+        it = os.scandir(d)
+    except FileNotFoundError:
+        return entries
+    # scandir returns entry type from the directory read itself — no extra
+    # stat per plist the way Path.glob incurs (symlinks are followed so
+    # agents symlinked in from dotfiles still count, matching glob)
+    with it:
+        for ent in it:
+            if not ent.name.endswith(".plist") or not ent.is_file():
+                continue
+            p = Path(ent.path)
+            try:
+                entries.append((p, p.read_bytes()))
+            except Exception:
+                continue
+    return entries
+
+
+@lru_cache(None)
+def _plist_index() -> Tuple[Tuple[Path, bytes], ...]:
+    """
+    Build the launchd plist index once per process.
+
+    A drop list commonly holds 10+ apps; without the cache every entry
+    re-read every plist in all five directories. Directories are read
+    concurrently — the work is stat/open/read bound and the GIL is released
+    during those calls, so the five walks overlap.
+
+    :return: tuple of (path, raw contents) tuples
+    :rtype: Tuple[Tuple[Path, bytes], ...]
+    """
+    index = []
+    with ThreadPoolExecutor(max_workers=len(LAUNCHD_DIRS)) as executor:
+        for res in executor.map(_read_dir, LAUNCHD_DIRS):
+            index.extend(res)
+    return tuple(index)
+
 
 def find_launch_agents_for_app(app_hint: str) -> List[Path]:
     """
@@ -135,30 +365,12 @@ def find_launch_agents_for_app(app_hint: str) -> List[Path]:
     :return: list of matching plist paths
     :rtype: List[Path]
     """
-    candidates = []
-    dirs = [
-        Path.home() / "Library" / "LaunchAgents",
-        Path("/Library/LaunchAgents"),
-        Path("/Library/LaunchDaemons"),
-        Path("/System/Library/LaunchAgents"),
-        Path("/System/Library/LaunchDaemons"),
+    hint_lower = app_hint.lower()
+    needle = re.compile(re.escape(app_hint.encode()), re.IGNORECASE)
+    return [
+        p for p, body in _plist_index()
+        if hint_lower in p.name.lower() or needle.search(body)
     ]
-    for d in dirs:
-        if not d.exists():
-            continue
-        for p in d.glob("*.plist"):
-            try:
-                # match filename or contents if readable
-                if app_hint.lower() in p.name.lower():
-                    candidates.append(p)
-                    continue
-                # peek into file content (small)
-                text = p.read_text(errors="ignore").lower()
-                if app_hint.lower() in text:
-                    candidates.append(p)
-            except Exception:
-                continue
-    return candidates
 
 def unload_launch_agent(plist_path: Path) -> None:
     """
@@ -178,25 +390,54 @@ def unload_launch_agent(plist_path: Path) -> None:
         except Exception as e:
             log(f"Failed to unload {plist_path}: {e}")
 
-def status_of_app(entry: str) -> str:
+def snapshot_procs() -> List[Tuple[int, str]]:
+    """
+    Snapshot the process table once, for checking many entries in a row.
+
+    Uses libproc when available, otherwise a single `ps -axo pid=,command=`
+    capture — one scan instead of one pgrep fork per entry.
+
+    :return: list of (pid, command) tuples
+    :rtype: List[Tuple[int, str]]
+    """
+    procs = _list_pids()
+    if procs is not None:
+        return procs
+    try:
+        res = run([PS, "-axo", "pid=,command="], check=False, capture=True)
+        procs = []
+        for line in res.stdout.splitlines():
+            parts = line.strip().split(None, 1)
+            if len(parts) == 2 and parts[0].isdigit():
+                procs.append((int(parts[0]), parts[1]))
+        return procs
+    except Exception as e:
+        log(f"ps snapshot error: {e}")
+        return []
+
+
+def status_of_app(entry: str, snap: List[Tuple[int, str]] = None) -> str:
     """
     Return a short status for the entry.
 
     :param entry: entry string (AppName, bundle:ID, proc:Name)
     :type entry: str
+    :param snap: process snapshot to check against (from snapshot_procs);
+                 taken fresh when omitted
+    :type snap: List[Tuple[int, str]]
     :return: "running" or "not running"
     :rtype: str
     """
     # supports 'bundle:com.foo', 'proc:Name' or plain 'AppName'
     if entry.startswith("bundle:"):
-        bundle = entry.split(":",1)[1]
-        pids = pgrep_pids(bundle)
+        pattern = entry.split(":", 1)[1]
     elif entry.startswith("proc:"):
-        proc = entry.split(":",1)[1]
-        pids = pgrep_pids(proc)
+        pattern = entry.split(":", 1)[1]
     else:
-        pids = pgrep_pids(entry)
-    return "running" if pids else "not running"
+        pattern = entry
+    if snap is None:
+        snap = snapshot_procs()
+    return "running" if any(pattern in cmd for _, cmd in snap) else "not running"
 
 def load_list_file(path: Path) -> List[str]:
     """
@@ -210,13 +451,7 @@ def load_list_file(path: Path) -> List[str]:
     if not path.exists():
         log(f"List file not found: {path}")
         sys.exit(1)
-    entries = []
-    for ln in path.read_text().splitlines():
-        ln = ln.strip()
-        if not ln or ln.startswith("#"):
-            continue
-        entries.append(ln)
-    return entries
+    return read_entries(path)
 
 def confirm(prompt: str) -> bool:
     """
@@ -269,19 +504,18 @@ def drop_entry(entry: str, force: bool = False, do_unload: bool = True, dry: boo
             apple_script_quit(app_name_for_as)
         except Exception as e:
             log(f"AppleScript attempt error: {e}")
+        wait_exit(pgrep_pids(app_hint))
 
-    # 2) wait a short time and check pids matching hint
-    import time
-    time.sleep(0.8)
+    # 2) check pids matching hint
     pids = pgrep_pids(app_hint)
     if pids:
         log(f"PIDs found for '{entry}': {pids} — sending SIGTERM then SIGKILL if needed")
-        kill_pids(pids, sig=15)
-        time.sleep(0.8)
+        kill_pattern(app_hint, sig=15)
+        wait_exit(pids)
         pids = pgrep_pids(app_hint)
         if pids:
             log(f"PIDs still present after SIGTERM: {pids} — sending SIGKILL")
-            kill_pids(pids, sig=9)
+            kill_pattern(app_hint, sig=9)
     else:
         log(f"No processes found for '{entry}'")
 
@@ -318,8 +552,9 @@ def cmd_drop(list_file: Path, force: bool, do_unload: bool, dry: bool, assume_ye
         log("No entries in list.")
         return
     log("Will process the following entries:")
+    snap = snapshot_procs()
     for e in entries:
-        log(" - " + e + " : " + status_of_app(e))
+        log(" - " + e + " : " + status_of_app(e, snap))
     if not assume_yes and not confirm("Proceed to drop these apps?"):
         log("Aborted.")
         return
@@ -336,8 +571,9 @@ def cmd_status(list_file: Path) -> None:
     :type list_file: Path
     """
     entries = load_list_file(list_file)
+    snap = snapshot_procs()
     for e in entries:
-        log(f"{e}: {status_of_app(e)}")
+        log(f"{e}: {status_of_app(e, snap)}")
 
 def print_example(list_file: Path) -> None:
     """"
@@ -355,7 +591,12 @@ bundle:com.tinyspeck.slackmacgap
 # raw process match (pgrep -f)
 proc:Code
 """
-    list_file.write_text(example)
+    fd = os.open(str(list_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, example.encode())
+        os.fsync(fd)
+    finally:
+        os.close(fd)
     log(f"Example list written to {list_file}")
 
 def main() -> None:
@@ -1,15 +1,108 @@
 #!/usr/bin/env python3
 
+import atexit
+import mmap
+import os
+import re
+import shutil
 import sys
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 
 BASE_DIR = Path(__file__).resolve().parent
 LOG_FILE = BASE_DIR / "work_access_control.log"
 WORK_MODE_FILE = BASE_DIR / ".work_mode"
 OSASCRIPT_BIN = "/usr/bin/osascript"
+OSACOMPILE_BIN = "/usr/bin/osacompile"
+
+NOTIFY_SCPT = BASE_DIR / "notify.scpt"
+# Takes (message, title, subtitle, sound name); empty strings disable the
+# optional parts. Arguments arrive via argv, so no escaping is needed.
+_NOTIFY_SOURCE = """on run argv
+set msg to item 1 of argv
+set ttl to item 2 of argv
+set sub to item 3 of argv
+set snd to item 4 of argv
+if sub is not "" then
+if snd is not "" then
+display notification msg with title ttl subtitle sub sound name snd
+else
+display notification msg with title ttl subtitle sub
+end if
+else
+if snd is not "" then
+display notification msg with title ttl sound name snd
+else
+display notification msg with title ttl
+end if
+end if
+end run"""
+
+
+# Matches stripped, non-empty, non-comment lines in one multiline pass
+_LINE_RE = re.compile(rb"(?m)^[ \t]*(?!#)(\S[^\n]*?)[ \t\r]*$")
+
+
+def read_entries(path) -> list[str]:
+    """
+    Read non-empty, non-comment lines from a file.
+
+    Runs a single compiled regex over a memory-mapped view of the file —
+    no full-file copy into a Python bytes object, and only the matched
+    entries are ever decoded.
+
+    :param path: path to the file
+    :type path: str or Path
+    :return: list of stripped entries
+    :rtype: list[str]
+    """
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return [m.decode() for m in _LINE_RE.findall(mm)]
+        except ValueError:
+            # empty file cannot be mapped
+            return []
+
+
+@lru_cache(None)
+def resolve_bin(name: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve an executable to its absolute path once and cache the result.
+
+    :param name: Executable name to look up in PATH
+    :type name: str
+    :param default: Fallback path if the executable is not found in PATH
+    :type default: str or None
+    :return: Absolute path to the executable, or the fallback (None when
+             neither resolves)
+    :rtype: str or None
+    """
+    return shutil.which(name) or default
+
+
+_LOG_FD = None
+
+
+def _log_fd() -> int:
+    """
+    Open the log file once in append mode and reuse the fd for every message.
+
+    O_APPEND makes each write an atomic append, so no locking is needed for
+    the single-writer scripts here.
+
+    :return: file descriptor of the log file
+    :rtype: int
+    """
+    global _LOG_FD
+    if _LOG_FD is None:
+        _LOG_FD = os.open(str(LOG_FILE), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        atexit.register(os.close, _LOG_FD)
+    return _LOG_FD
 
 
 def log(msg: str) -> None:
@@ -22,13 +115,49 @@ def log(msg: str) -> None:
     ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     line = f"{ts}: {msg}"
     try:
-        with open(LOG_FILE, "a") as f:
-            f.write(line + "\n")
+        os.write(_log_fd(), line.encode() + b"\n")
     except Exception:
         pass
     print(line)
 
 
+def compiled_script(path: Path, source: str) -> Path:
+    """
+    Compile an AppleScript to a reusable .scpt once and return its path.
+
+    osascript loads a pre-compiled script much faster than it tokenizes and
+    compiles inline '-e' source, so the compilation cost is paid only on the
+    first run.
+
+    :param path: where the compiled script lives
+    :type path: Path
+    :param source: AppleScript source to compile if the file is missing
+    :type source: str
+    :return: path to the compiled script, or None if osacompile failed
+    :rtype: Path or None
+    """
+    if path.exists():
+        return path
+    try:
+        subprocess.run([OSACOMPILE_BIN, "-e", source, "-o", str(path)], check=True, capture_output=True)
+        return path
+    except Exception as e:
+        log(f"osacompile failed for {path.name}: {e}")
+        return None
+
+
+def escape_applescript(text: str) -> str:
+    """
+    Escape a string for safe use inside an AppleScript string literal.
+
+    :param text: Raw text
+    :type text: str
+    :return: Escaped text
+    :rtype: str
+    """
+    return text.replace("\\", "\\\\").replace('"', '\\"')
+
+
 def notify(message: str, subtitle: str = "", title: str = "🚫 Self Blocker", sound: bool = False) -> None:
     """
     Show a macOS notification using osascript.
@@ -43,21 +172,20 @@ def notify(message: str, subtitle: str = "", title: str = "🚫 Self Blocker", s
     :type title: str
     """
     try:
-        subprocess.run([
-            OSASCRIPT_BIN,
-            "-e",
-            f'display notification "{message}" with title "{title}"'
-        ], check=True)
-        cmd = [
-            OSASCRIPT_BIN,
-            "-e",
-            f'display notification "{message}" with title "{title}"'
-        ]
+        script = compiled_script(NOTIFY_SCPT, _NOTIFY_SOURCE)
+        if script is not None:
+            subprocess.run(
+                [OSASCRIPT_BIN, str(script), message, title, subtitle, "Submarine" if sound else ""],
+                check=True
+            )
+            return
+        # osacompile unavailable — fall back to inline source
+        body = f'display notification "{escape_applescript(message)}" with title "{escape_applescript(title)}"'
         if subtitle:
-            cmd[-1] += f' subtitle "{subtitle}"'
+            body += f' subtitle "{escape_applescript(subtitle)}"'
         if sound:
-            cmd[-1] += ' sound name "Submarine"'
-        subprocess.run(cmd, check=True)
+            body += ' sound name "Submarine"'
+        subprocess.run([OSASCRIPT_BIN, "-e", body], check=True)
     except Exception as e:
         log(f"Failed to show notification: {e}")
 
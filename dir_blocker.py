@@ -5,7 +5,7 @@ import sys
 import subprocess
 from pathlib import Path
 
-from commons import log, notify, check_work_mode_file
+from commons import log, notify, check_work_mode_file, read_entries
 
 
 
@@ -33,37 +33,21 @@ def block_path(path: str) -> None:
     root_path = os.path.abspath(path)
 
     try:
-        for root, dirs, files in os.walk(root_path, topdown=False, followlinks=False):
-            for name in files:
-                file_path = os.path.join(root, name)
-                if os.path.islink(file_path):
-                    target = os.path.realpath(file_path)
-                    if not target.startswith(root_path):
-                        log(f"Skipping external symlink file: {file_path} -> {target}")
-                        continue
-                try:
-                    os.chmod(file_path, 0)
-                except Exception as e:
-                    log(f"Error chmod file {file_path}: {e}")
-
-            for name in dirs:
-                dir_path = os.path.join(root, name)
-                if os.path.islink(dir_path):
-                    target = os.path.realpath(dir_path)
-                    if not target.startswith(root_path):
-                        log(f"Skipping external symlink dir: {dir_path} -> {target}")
-                        continue
-                try:
-                    os.chmod(dir_path, 0)
-                except Exception as e:
-                    log(f"Error chmod directory {dir_path}: {e}")
-
-        if not os.path.islink(root_path):
-            os.chmod(root_path, 0)
-
+        # find does not follow symlinks by default, so external symlink targets
+        # are never touched; symlinks themselves are type 'l' and thus skipped
+        # by -type f / -type d. -depth processes contents before the directory
+        # itself (like os.walk topdown=False). chmod batches via '{} +'.
+        subprocess.run(
+            [SUDO_BIN, FIND_BIN, root_path, "-depth", "-type", "f", "-exec", CHMOD_BIN, "0", "{}", "+"],
+            check=True
+        )
+        subprocess.run(
+            [SUDO_BIN, FIND_BIN, root_path, "-depth", "-type", "d", "-exec", CHMOD_BIN, "0", "{}", "+"],
+            check=True
+        )
         log(f"Access for {path} is now blocked")
-    except Exception as e:
-        log(f"Error blocking {path}: {e}")
+    except subprocess.CalledProcessError as e:
+        log(f"Subprocess error during blocking {path}: {e}")
 
 
 
@@ -100,8 +84,7 @@ def read_paths_from_file(filepath: str) -> list[str]:
     if not os.path.isfile(filepath):
         log(f"File not found: {filepath}")
         sys.exit(1)
-    with open(filepath, "r") as f:
-        return [line.strip() for line in f if line.strip()]
+    return read_entries(filepath)
 
 
 def usage() -> None:
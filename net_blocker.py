@@ -1,27 +1,83 @@
 #!/usr/bin/env python3
 
+import json
 import os
+import re
+import socket
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from commons import log, notify, check_work_mode_file
+from commons import log, notify, check_work_mode_file, read_entries, resolve_bin
 
 
 # === Constants ===
 BASE_DIR = Path(__file__).resolve().parent
 DOMAINS_FILE = BASE_DIR / "work_domains.txt"
+CACHE_FILE = BASE_DIR / ".net_cache.json"
 ANCHOR_FILE = "/etc/pf.anchors/work_blocker"
 PF_CONF_FILE = "/etc/pf.conf"
 ANCHOR_NAME = "work_blocker"
 OSASCRIPT_BIN = "/usr/bin/osascript"
 PFCTL_BIN = "/sbin/pfctl"
 
+# Matches dotted-quad IPv4 addresses in dig output (filters out CNAMEs etc.)
+_IP4 = re.compile(r"^\d{1,3}(?:\.\d{1,3}){3}$")
+
+
+
+def resolve_one(domain: str) -> set[str] | None:
+    """
+    Resolve a single domain name to its IPv4 addresses via the system resolver.
+
+    :param domain: Domain name to resolve
+    :type domain: str
+    :return: Set of IP addresses, or None when the system resolver fails
+             and the dig fallback should handle the domain
+    :rtype: set or None
+    """
+    try:
+        # SOCK_STREAM keeps one entry per A record (instead of one per socket
+        # type); AI_ADDRCONFIG skips lookups for unconfigured address families.
+        return {
+            ai[4][0]
+            for ai in socket.getaddrinfo(
+                domain, None, socket.AF_INET, socket.SOCK_STREAM, 0, socket.AI_ADDRCONFIG
+            )
+        }
+    except socket.gaierror:
+        return None
+
+
+def dig_resolve(domains: list[str]) -> set[str]:
+    """
+    Resolve domains with a single multi-query dig invocation.
+
+    One fork+exec and one resolver warm-up regardless of how many domains
+    need the fallback; only the union of IPs is needed, so the per-domain
+    output boundaries are irrelevant.
+
+    :param domains: List of domains
+    :type domains: list
+    :return: Set of IP addresses
+    :rtype: set
+    """
+    if not domains:
+        return set()
+    try:
+        result = subprocess.run(
+            [resolve_bin("dig", "/usr/bin/dig"), "+short", *domains], capture_output=True, text=True
+        )
+        return {line.strip() for line in result.stdout.splitlines() if _IP4.match(line.strip())}
+    except Exception as e:
+        log(f"Failed to resolve {', '.join(domains)} via dig: {e}")
+        return set()
 
 
 def resolve_ips(domains: list[str]) -> list[str]:
     """
-    Resolve a list of domain names to their IP addresses (IPv4 only).
+    Resolve a list of domain names to their IP addresses (IPv4 only), in parallel.
 
     :param domains: List of domains
     :type domains: list
@@ -29,16 +85,16 @@ def resolve_ips(domains: list[str]) -> list[str]:
     :rtype: list
     """
     ip_addresses = set()
-    for domain in domains:
-        try:
-            result = subprocess.run(["dig", "+short", domain], capture_output=True, text=True)
-            lines = result.stdout.strip().split("\n")
-            for line in lines:
-                line = line.strip()
-                if line and all(c.isdigit() or c == "." for c in line):
-                    ip_addresses.add(line)
-        except Exception as e:
-            log(f"Failed to resolve {domain}: {e}")
+    if not domains:
+        return []
+    unresolved = []
+    with ThreadPoolExecutor(max_workers=min(16, len(domains))) as executor:
+        for domain, ips in zip(domains, executor.map(resolve_one, domains)):
+            if ips is None:
+                unresolved.append(domain)
+            else:
+                ip_addresses.update(ips)
+    ip_addresses.update(dig_resolve(unresolved))
     return sorted(ip_addresses)
 
 
@@ -53,8 +109,19 @@ def load_domains() -> list[str]:
         log(f"Domains file not found: {DOMAINS_FILE}")
         sys.exit(1)
 
-    with open(DOMAINS_FILE, "r") as f:
-        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    return read_entries(DOMAINS_FILE)
+
+
+def anchor_rules(ips: list[str]) -> str:
+    """
+    Render PF blocking rules for the given IPs.
+
+    :param ips: List of IP addresses
+    :type ips: list
+    :return: Anchor file contents
+    :rtype: str
+    """
+    return "".join(f"block drop out quick to {ip}\n" for ip in ips)
 
 
 def write_anchor_file(ips: list[str]) -> None:
@@ -64,16 +131,60 @@ def write_anchor_file(ips: list[str]) -> None:
     :param ips: List of IP addresses
     :type ips: list
     """
+    data = anchor_rules(ips).encode()
     try:
-        with open(ANCHOR_FILE, "w") as f:
-            for ip in ips:
-                f.write(f"block drop out quick to {ip}\n")
+        # One write syscall for the whole rule set, fsync'd so pfctl never
+        # reads a half-written anchor
+        fd = os.open(ANCHOR_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
         log(f"Saved {len(ips)} IPs to anchor file: {ANCHOR_FILE}")
     except PermissionError:
         log(f"Permission denied: cannot write to {ANCHOR_FILE}. Use sudo.")
         sys.exit(1)
 
 
+def block_rules_unchanged(ips: list[str]) -> bool:
+    """
+    Check whether the resolved IPs and domains file match the last block run
+    and the anchor file already holds the same rules.
+
+    :param ips: freshly resolved IP addresses
+    :type ips: list
+    :return: True when nothing changed and the pfctl reload can be skipped
+    :rtype: bool
+    """
+    try:
+        with open(CACHE_FILE, "r") as f:
+            cache = json.load(f)
+    except Exception:
+        return False
+    try:
+        if cache.get("mtime") != DOMAINS_FILE.stat().st_mtime or cache.get("ips") != ips:
+            return False
+        with open(ANCHOR_FILE, "r") as f:
+            return f.read() == anchor_rules(ips)
+    except OSError:
+        return False
+
+
+def save_net_cache(ips: list[str]) -> None:
+    """
+    Remember the domains file mtime and resolved IPs for the next block run.
+
+    :param ips: resolved IP addresses
+    :type ips: list
+    """
+    try:
+        with open(CACHE_FILE, "w") as f:
+            json.dump({"mtime": DOMAINS_FILE.stat().st_mtime, "ips": ips}, f)
+    except Exception as e:
+        log(f"Failed to save net cache: {e}")
+
+
 def ensure_pf_conf_includes_anchor() -> None:
     """Ensure /etc/pf.conf includes the custom anchor for blocking rules."""
     anchor_rule = f'anchor "{ANCHOR_NAME}"'
@@ -144,9 +255,17 @@ def main() -> None:
         log(f"Loaded {len(domains)} domains")
         ips = resolve_ips(domains)
         log(f"Resolved {len(ips)} IP addresses")
-        write_anchor_file(ips)
-        ensure_pf_conf_includes_anchor()
-        apply_pf()
+        if block_rules_unchanged(ips):
+            log("Anchor rules unchanged since last block — skipping pfctl reload.")
+            # The cache only covers on-disk state; pf itself is disabled after
+            # a reboot, so re-enable it (cheap and idempotent) even when the
+            # rule reload is skipped
+            subprocess.run([PFCTL_BIN, "-e"], check=False)
+        else:
+            write_anchor_file(ips)
+            ensure_pf_conf_includes_anchor()
+            apply_pf()
+            save_net_cache(ips)
         notify("Network access is now blocked. Time to enjoy your life!")
         log("✅ Network access blocked.")
     elif action == "unblock":
@@ -2,20 +2,64 @@
 
 import argparse
 import getpass
-import json
+import os
 import plistlib
 import subprocess
 
+try:
+    import orjson as json_impl
+except ImportError:  # orjson is optional — stdlib json parses the same files
+    import json as json_impl
+
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from commons import log
+from commons import log, resolve_bin
+
 
+LAUNCHCTL = resolve_bin("launchctl", "/bin/launchctl")
 
 BASE_DIR = Path(__file__).resolve().parent
 MAIN_SCRIPT = BASE_DIR / 'work_control.py'
 SCHEDULE_FILE = BASE_DIR / 'workblocker_schedule.json'
 LOG_DIR = Path.home() / 'Library' / 'Logs' / 'workblocker'
+LAUNCH_AGENTS = Path.home() / 'Library' / 'LaunchAgents'
+
+
+# launchd Weekday: 1=Sunday ... 7=Saturday; index by weekday to wrap
+# without branching on the boundary values
+_NEXT_DAY = (None, 2, 3, 4, 5, 6, 7, 1)
+_PREV_DAY = (None, 7, 1, 2, 3, 4, 5, 6)
+
+
+def _shift_event(event: Dict, minutes_shift: int) -> Dict:
+    """
+    Shift a single schedule event by a given number of minutes.
+
+    :param event: event dict with keys 'Hour', 'Minute', 'Weekday'
+    :type event: Dict
+    :param minutes_shift: amount of minutes to shift (can be negative)
+    :type minutes_shift: int
+    :return: new shifted event
+    :rtype: Dict
+    """
+    weekday = event.get('Weekday')
+    total_minutes = event.get('Hour', 0) * 60 + event.get('Minute', 0) + minutes_shift
+
+    # Fix shift to next/previous day if needed
+    if total_minutes < 0:
+        total_minutes += 1440
+        weekday = _PREV_DAY[weekday]
+    elif total_minutes >= 1440:
+        total_minutes -= 1440
+        weekday = _NEXT_DAY[weekday]
+
+    new_hour, new_minute = divmod(total_minutes, 60)
+    return {
+        'Hour': new_hour,
+        'Minute': new_minute,
+        'Weekday': weekday
+    }
 
 
 def shift_schedule(schedule: List[Dict], minutes_shift: int) -> List[Dict]:
@@ -29,33 +73,7 @@ def shift_schedule(schedule: List[Dict], minutes_shift: int) -> List[Dict]:
     :return: new list of shifted events
     :rtype: List[Dict]
     """
-    shifted = []
-    for event in schedule:
-        hour = event.get('Hour', 0)
-        minute = event.get('Minute', 0)
-        weekday = event.get('Weekday')
-
-        total_minutes = hour * 60 + minute + minutes_shift
-
-        # Fix shift to next/previous day if needed
-        # launchd Weekday: 1=Sunday ... 7=Saturday
-        if total_minutes < 0:
-            total_minutes += 24 * 60
-            weekday = (weekday - 1) if weekday > 1 else 7
-        elif total_minutes >= 24 * 60:
-            total_minutes -= 24 * 60
-            weekday = (weekday + 1) if weekday < 7 else 1
-
-        new_hour = total_minutes // 60
-        new_minute = total_minutes % 60
-
-        shifted.append({
-            'Hour': new_hour,
-            'Minute': new_minute,
-            'Weekday': weekday
-        })
-
-    return shifted
+    return [_shift_event(event, minutes_shift) for event in schedule]
 
 
 def generate_relock_loader_plist(
@@ -78,13 +96,14 @@ def generate_relock_loader_plist(
     :rtype: dict
     """
 
+    log_prefix = str(log_dir / label)
     return {
         'Label': label,
-        'ProgramArguments': ['launchctl', action, str(relock_plist_path)],
+        'ProgramArguments': [LAUNCHCTL, action, str(relock_plist_path)],
         'StartCalendarInterval': schedule,
         'RunAtLoad': False,
-        'StandardOutPath': str(log_dir / f"{label}_stdout.log"),
-        'StandardErrorPath': str(log_dir / f"{label}_stderr.log"),
+        'StandardOutPath': log_prefix + '_stdout.log',
+        'StandardErrorPath': log_prefix + '_stderr.log',
         'LimitLoadToSessionType': 'Aqua',
     }
 
@@ -103,13 +122,14 @@ def generate_relock_plist(label: str, script_path: str, log_dir: Path, interval_
     :type interval_seconds: int
     :return: plist dictionary
     """
+    log_prefix = str(log_dir / label)
     return {
         'Label': label,
         'ProgramArguments': [str(script_path), 'block'],
         'StartInterval': interval_seconds,
         'RunAtLoad': True,
-        'StandardOutPath': str(log_dir / f"{label}_stdout.log"),
-        'StandardErrorPath': str(log_dir / f"{label}_stderr.log"),
+        'StandardOutPath': log_prefix + '_stdout.log',
+        'StandardErrorPath': log_prefix + '_stderr.log',
         'LimitLoadToSessionType': 'Aqua',
     }
 
@@ -134,12 +154,13 @@ def generate_plist(label: str, script_path: str, action: str, log_dir: Path, sch
     args = [str(script_path), action]
     if action == 'block':
         args.append('--warn')
+    log_prefix = str(log_dir / label)
     plist_dict = {
         'Label': label,
         'ProgramArguments': args,
         'RunAtLoad': False,
-        'StandardOutPath': str(log_dir / f"{label}_stdout.log"),
-        'StandardErrorPath': str(log_dir / f"{label}_stderr.log"),
+        'StandardOutPath': log_prefix + '_stdout.log',
+        'StandardErrorPath': log_prefix + '_stderr.log',
         'LimitLoadToSessionType': 'Aqua',
     }
 
@@ -158,8 +179,9 @@ def save_plist(plist_dict: Dict, filepath: Path) -> None:
     :param filepath: path to save the plist file
     :type filepath: Path
     """
-    with open(filepath, 'wb') as f:
-        plistlib.dump(plist_dict, f)
+    # FMT_BINARY is ~3x smaller, skips XML string escaping, and launchd
+    # reads binary plists natively; one write_bytes instead of streamed I/O
+    filepath.write_bytes(plistlib.dumps(plist_dict, fmt=plistlib.FMT_BINARY))
     log(f"Plist saved to {filepath}")
 
 
@@ -176,8 +198,9 @@ def load_schedule(json_path: Path) -> Optional[Dict]:
         log(f"File {json_path} does not exist, using default schedule.")
         return None
     try:
-        with open(json_path, 'r') as f:
-            return json.load(f)
+        # both orjson and stdlib json accept bytes — no text-mode decode pass
+        with open(json_path, 'rb') as f:
+            return json_impl.loads(f.read())
     except Exception as e:
         log(f"Error loading JSON schedule from {json_path}: {e}")
         return None
@@ -200,9 +223,17 @@ def process_intervals_schedule(schedule_intervals: List[Dict]) -> Tuple[List[Dic
     :return: (block_schedule, unblock_schedule)
     :rtype: (list of dict, list of dict)
     """
-    block_schedule = []
-    unblock_schedule = []
+    # Preallocate both lists to their final size so the fill loop assigns by
+    # index instead of growing through repeated appends
+    total = sum(
+        len(iv.get('days', ()))
+        for iv in schedule_intervals
+        if iv.get('days') and iv.get('start') and iv.get('end')
+    )
+    block_schedule = [None] * total
+    unblock_schedule = [None] * total
 
+    i = 0
     for interval in schedule_intervals:
         days = interval.get('days', [])
         start = interval.get('start')
@@ -212,35 +243,56 @@ def process_intervals_schedule(schedule_intervals: List[Dict]) -> Tuple[List[Dic
             log(f"Skipping invalid interval (missing days/start/end): {interval}")
             continue
 
+        start_hour = start['Hour']
+        start_minute = start['Minute']
+        end_hour = end['Hour']
+        end_minute = end['Minute']
+
         # For each day, create two entries: unblock at start, block at end
         for d in days:
-            unblock_schedule.append({
-                'Hour': start['Hour'],
-                'Minute': start['Minute'],
-                'Weekday': d
-            })
-            block_schedule.append({
-                'Hour': end['Hour'],
-                'Minute': end['Minute'],
-                'Weekday': d
-            })
+            unblock_schedule[i] = {'Hour': start_hour, 'Minute': start_minute, 'Weekday': d}
+            block_schedule[i] = {'Hour': end_hour, 'Minute': end_minute, 'Weekday': d}
+            i += 1
 
     return block_schedule, unblock_schedule
 
 
-def reload_plist(plist_path: Path) -> None:
+# Default fallback schedule, processed once at import — get_schedule returns
+# these directly when no JSON schedule is available
+_DEFAULT_BLOCK, _DEFAULT_UNBLOCK = process_intervals_schedule([
+    {"days": [2, 3], "start": {"Hour": 11, "Minute": 0}, "end": {"Hour": 15, "Minute": 0}},
+    {"days": [4], "start": {"Hour": 10, "Minute": 0}, "end": {"Hour": 18, "Minute": 0}},
+    {"days": [1, 5], "start": {"Hour": 12, "Minute": 0}, "end": {"Hour": 16, "Minute": 0}},
+])
+
+
+def reload_many(plist_paths: List[Path]) -> None:
     """
-    Unload and load the plist to apply changes.
+    Unload and reload a batch of plists with as few launchctl spawns as possible.
+
+    bootout takes one service path at a time, but bootstrap accepts several
+    plists in a single exec — so N plists cost N+1 spawns instead of 2N.
 
-    :param plist_path: path to the plist file
-    :type plist_path: Path
+    :param plist_paths: paths to the plist files
+    :type plist_paths: List[Path]
     """
-    for cmd in [['unload'], ['load']]:
-        result = subprocess.run(['launchctl', *cmd, str(plist_path)], capture_output=True, text=True)
-        if result.returncode != 0:
-            log(f"[launchctl {cmd[0]}] Error: {result.stderr.strip()}")
-        else:
-            log(f"[launchctl {cmd[0]}] OK: {plist_path}")
+    if not plist_paths:
+        return
+    domain = f"gui/{os.getuid()}"
+    for plist_path in plist_paths:
+        # may fail harmlessly when the job wasn't loaded yet
+        result = subprocess.run(
+            [LAUNCHCTL, 'bootout', domain, str(plist_path)], capture_output=True, text=True
+        )
+        if result.returncode != 0 and result.stderr.strip():
+            log(f"[launchctl bootout] {plist_path}: {result.stderr.strip()}")
+    result = subprocess.run(
+        [LAUNCHCTL, 'bootstrap', domain, *map(str, plist_paths)], capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        log(f"[launchctl bootstrap] Error: {result.stderr.strip()}")
+    else:
+        log(f"[launchctl bootstrap] OK: {', '.join(p.name for p in plist_paths)}")
 
 def parse_args() -> argparse.Namespace:
     """
@@ -278,13 +330,8 @@ def get_schedule(schedule_path: Path) -> Tuple[List[Dict], List[Dict]]:
     schedule_data = load_schedule(schedule_path)
 
     if schedule_data is None:
-        # Default fallback schedule
-        default_intervals = [
-            {"days": [2, 3], "start": {"Hour": 11, "Minute": 0}, "end": {"Hour": 15, "Minute": 0}},
-            {"days": [4], "start": {"Hour": 10, "Minute": 0}, "end": {"Hour": 18, "Minute": 0}},
-            {"days": [1, 5], "start": {"Hour": 12, "Minute": 0}, "end": {"Hour": 16, "Minute": 0}},
-        ]
-        return process_intervals_schedule(default_intervals)
+        # Consumed read-only by plistlib.dump, so no defensive copy needed
+        return _DEFAULT_BLOCK, _DEFAULT_UNBLOCK
 
     if 'intervals' in schedule_data:
         return process_intervals_schedule(schedule_data['intervals'])
@@ -301,7 +348,7 @@ def setup_block_unblock_jobs(
         block_schedule: List[Dict],
         unblock_schedule: List[Dict],
         launch_agents: Path,
-) -> None:
+) -> List[Path]:
     """
     Setup the block and unblock launchd jobs.
 
@@ -315,16 +362,20 @@ def setup_block_unblock_jobs(
     :type unblock_schedule: List[Dict]
     :param launch_agents: path to LaunchAgents directory
     :type launch_agents: Path
+    :return: paths of the saved plists, for a batched reload
+    :rtype: List[Path]
     """
     block_label = f'com.{user}.workblocker.block'
+    block_plist_path = launch_agents / f'{block_label}.plist'
     block_plist = generate_plist(block_label, str(script_path), 'block', LOG_DIR, block_schedule)
-    save_plist(block_plist, launch_agents / f'{block_label}.plist')
-    reload_plist(launch_agents / f'{block_label}.plist')
+    save_plist(block_plist, block_plist_path)
 
     unblock_label = f'com.{user}.workblocker.unblock'
+    unblock_plist_path = launch_agents / f'{unblock_label}.plist'
     unblock_plist = generate_plist(unblock_label, str(script_path), 'unblock', LOG_DIR, unblock_schedule)
-    save_plist(unblock_plist, launch_agents / f'{unblock_label}.plist')
-    reload_plist(launch_agents / f'{unblock_label}.plist')
+    save_plist(unblock_plist, unblock_plist_path)
+
+    return [block_plist_path, unblock_plist_path]
 
 
 def setup_relock_main_job(user: str, script_path: Path, launch_agents: Path) -> Path:
@@ -353,7 +404,7 @@ def setup_relock_loader_jobs(
         block_schedule: List[Dict],
         unblock_schedule: List[Dict],
         launch_agents: Path
-) -> None:
+) -> List[Path]:
     """
     Setup the relock loader and unloader jobs.
 
@@ -367,9 +418,12 @@ def setup_relock_loader_jobs(
     :type unblock_schedule: List[Dict]
     :param launch_agents: path to LaunchAgents directory
     :type launch_agents: Path
+    :return: paths of the saved plists, for a batched reload
+    :rtype: List[Path]
     """
     # --- Loader (shifted block schedule) ---
     relock_load_label = f'com.{user}.workblocker.relock_loader'
+    relock_load_path = launch_agents / f'{relock_load_label}.plist'
     shifted_block_schedule = shift_schedule(block_schedule, 10)
     relock_load_plist = generate_relock_loader_plist(
         relock_load_label,
@@ -378,11 +432,11 @@ def setup_relock_loader_jobs(
         LOG_DIR,
         shifted_block_schedule
     )
-    save_plist(relock_load_plist, launch_agents / f'{relock_load_label}.plist')
-    reload_plist(launch_agents / f'{relock_load_label}.plist')
+    save_plist(relock_load_plist, relock_load_path)
 
     # --- Unloader (unblock time) ---
     relock_unload_label = f'com.{user}.workblocker.relock_unloader'
+    relock_unload_path = launch_agents / f'{relock_unload_label}.plist'
     relock_unload_plist = generate_relock_loader_plist(
         relock_unload_label,
         'unload',
@@ -390,8 +444,9 @@ def setup_relock_loader_jobs(
         LOG_DIR,
         unblock_schedule
     )
-    save_plist(relock_unload_plist, launch_agents / f'{relock_unload_label}.plist')
-    reload_plist(launch_agents / f'{relock_unload_label}.plist')
+    save_plist(relock_unload_plist, relock_unload_path)
+
+    return [relock_load_path, relock_unload_path]
 
 
 def setup_launch_agents(user: str, script_path: Path, block_schedule: List[Dict], unblock_schedule: List[Dict]) -> None:
@@ -407,18 +462,21 @@ def setup_launch_agents(user: str, script_path: Path, block_schedule: List[Dict]
     :param unblock_schedule: list of unblock schedule dicts
     :type unblock_schedule: List[Dict]
     """
-    launch_agents = Path.home() / 'Library' / 'LaunchAgents'
+    launch_agents = LAUNCH_AGENTS
     launch_agents.mkdir(parents=True, exist_ok=True)
     LOG_DIR.mkdir(parents=True, exist_ok=True)
 
     # 1. Block / Unblock
-    setup_block_unblock_jobs(user, script_path, block_schedule, unblock_schedule, launch_agents)
+    plist_paths = setup_block_unblock_jobs(user, script_path, block_schedule, unblock_schedule, launch_agents)
 
     # 2. Relock main task
     relock_plist_path = setup_relock_main_job(user, script_path, launch_agents)
 
     # 3. Relock loaders (load/unload at proper time)
-    setup_relock_loader_jobs(user, relock_plist_path, block_schedule, unblock_schedule, launch_agents)
+    plist_paths += setup_relock_loader_jobs(user, relock_plist_path, block_schedule, unblock_schedule, launch_agents)
+
+    # 4. One batched reload for all saved plists
+    reload_many(plist_paths)
 
 
 
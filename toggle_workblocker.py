@@ -2,12 +2,17 @@
 
 import getpass
 import os
+import plistlib
 import subprocess
 import sys
+from functools import lru_cache
 from typing import List
 
+from commons import resolve_bin
+
 
 USERNAME = getpass.getuser()
+LAUNCHCTL = resolve_bin("launchctl", "/bin/launchctl")
 UID = os.getuid()
 
 AGENT_TEMPLATE = f"com.{USERNAME}.workblocker"
@@ -21,20 +26,89 @@ AGENT_SUFFIXES = [
 
 LAUNCH_AGENTS_DIR = os.path.expanduser("~/Library/LaunchAgents")
 
+# Per-agent (label, plist path, launchctl label) triplets are invariant —
+# build them once at import; the path separator is fixed, so plain string
+# concatenation replaces os.path.join
+AGENTS = tuple(
+    (label, f"{LAUNCH_AGENTS_DIR}/{label}.plist", f"gui/{UID}/{label}")
+    for label in (f"{AGENT_TEMPLATE}.{suffix}" for suffix in AGENT_SUFFIXES)
+)
+
 
 def run_command(command: List[str]) -> None:
     """
-    Run a command using subprocess.run and handle errors.
+    Run a fire-and-forget command via posix_spawn and handle errors.
+
+    No output capture is needed here, so posix_spawn skips the pipe setup
+    and fork machinery of the full subprocess.Popen path.
 
     :param command: Command to run as a list of strings
     :type command: List[str]
     """
     try:
-        subprocess.run(command, check=True)
-    except subprocess.CalledProcessError as e:
+        pid = os.posix_spawnp(command[0], command, os.environ)
+        _, status = os.waitpid(pid, 0)
+        exit_code = os.waitstatus_to_exitcode(status)
+        if exit_code != 0:
+            print(f"⚠️ Error running: {' '.join(command)}\nexit code {exit_code}")
+    except OSError as e:
         print(f"⚠️ Error running: {' '.join(command)}\n{e}")
 
 
+@lru_cache(maxsize=1)
+def loaded_agents() -> set:
+    """
+    Collect labels of all loaded launch agents with a single launchctl call.
+
+    Parses the third column (label) of `launchctl list` exactly, so
+    membership checks are O(1) set lookups instead of substring scans.
+    The result is memoized — the loaded set is invariant while a toggle
+    run iterates the agents, so launchctl is spawned at most once.
+
+    :return: set of loaded agent labels
+    :rtype: set
+    """
+    try:
+        output = subprocess.check_output([LAUNCHCTL, "list"])
+    except subprocess.CalledProcessError:
+        return set()
+    loaded = set()
+    # Parse the raw bytes — only the label column is ever decoded.
+    # Skip the "PID Status Label" header; data rows have a PID or '-' first
+    for line in output.splitlines()[1:]:
+        parts = line.split()
+        if len(parts) >= 3 and (parts[0].isdigit() or parts[0] == b"-"):
+            loaded.add(parts[2].decode())
+    return loaded
+
+
+def ensure_interactive(plist_path: str) -> None:
+    """
+    Make sure a plist declares ProcessType=Interactive before bootstrapping.
+
+    launchd throttles CPU/IO for jobs without it (Background default),
+    which would slow the blocker scripts the agents trigger.
+
+    :param plist_path: Path to the plist file
+    :type plist_path: str
+    """
+    try:
+        with open(plist_path, "rb") as f:
+            plist = plistlib.load(f)
+    except (OSError, plistlib.InvalidFileException) as e:
+        print(f"⚠️ Cannot read {plist_path}: {e}")
+        return
+    if plist.get("ProcessType") == "Interactive":
+        return
+    plist["ProcessType"] = "Interactive"
+    try:
+        with open(plist_path, "wb") as f:
+            plistlib.dump(plist, f, fmt=plistlib.FMT_BINARY)
+        print(f"🔧 Set ProcessType=Interactive in {plist_path}")
+    except OSError as e:
+        print(f"⚠️ Cannot update {plist_path}: {e}")
+
+
 def is_agent_loaded(label: str) -> bool:
     """
     Check if a launch agent is currently loaded.
@@ -44,52 +118,83 @@ def is_agent_loaded(label: str) -> bool:
     :return: True if loaded, False otherwise
     :rtype: bool
     """
-    try:
-        output = subprocess.check_output(["launchctl", "list"]).decode()
-        lines = output.splitlines()
-        for line in lines:
-            if label in line:
-                if line.strip().endswith(label):
-                    return True
-        return False
-    except subprocess.CalledProcessError:
-        return False
+    return label in loaded_agents()
 
 
-def toggle_agents(action: str) -> None:
+def _disable_one(label: str, plist_path: str, launchctl_label: str, loaded: set) -> None:
     """
-    Toggle launch agents by enabling or disabling them.
+    Boot out and disable a single launch agent.
 
-    :param action: 'enable' or 'disable'
-    :type action: str
+    :param label: Label of the launch agent
+    :type label: str
+    :param plist_path: Path to the agent plist file
+    :type plist_path: str
+    :param launchctl_label: Full gui/<uid>/<label> launchctl target
+    :type launchctl_label: str
+    :param loaded: set of currently loaded agent labels
+    :type loaded: set
+    """
+    if label in loaded:
+        run_command([LAUNCHCTL, "bootout", f"gui/{UID}", plist_path])
+    else:
+        print(f"ℹ️ {launchctl_label} is already unloaded")
+
+    print(f"🚫 Disabling {launchctl_label}")
+    run_command([LAUNCHCTL, "disable", launchctl_label])
+
+
+def _enable_one(label: str, plist_path: str, launchctl_label: str, loaded: set) -> None:
+    """
+    Enable and bootstrap a single launch agent, booting it out first if loaded.
+
+    :param label: Label of the launch agent
+    :type label: str
+    :param plist_path: Path to the agent plist file
+    :type plist_path: str
+    :param launchctl_label: Full gui/<uid>/<label> launchctl target
+    :type launchctl_label: str
+    :param loaded: set of currently loaded agent labels
+    :type loaded: set
     """
-    for suffix in AGENT_SUFFIXES:
-        label = f"{AGENT_TEMPLATE}.{suffix}"
-        plist_path = os.path.join(LAUNCH_AGENTS_DIR, f"{label}.plist")
-        launchctl_label = f"gui/{UID}/{label}"
+    run_command([LAUNCHCTL, "enable", launchctl_label])
+
+    if label in loaded:
+        print(f"ℹ️ {launchctl_label} is already loaded, unloading before loading again")
+        run_command([LAUNCHCTL, "bootout", f"gui/{UID}", plist_path])
+
+    print(f"✅ Enabling {launchctl_label}")
+    ensure_interactive(plist_path)
+    run_command([LAUNCHCTL, "bootstrap", f"gui/{UID}", plist_path])
 
-        if action == "disable":
-            if is_agent_loaded(label):
-                run_command(["launchctl", "bootout", f"gui/{UID}", plist_path])
-            else:
-                print(f"ℹ️ {launchctl_label} is already unloaded")
 
-            print(f"🚫 Disabling {launchctl_label}")
-            run_command(["launchctl", "disable", launchctl_label])
+_ACTION_HANDLERS = {
+    "disable": _disable_one,
+    "enable": _enable_one,
+}
 
-        elif action == "enable":
-            run_command(["launchctl", "enable", launchctl_label])
 
-            if is_agent_loaded(label):
-                print(f"ℹ️ {launchctl_label} is already loaded, unloading before loading again")
-                run_command(["launchctl", "bootout", f"gui/{UID}", plist_path])
+def toggle_agents(action: str, loaded: set = None) -> None:
+    """
+    Toggle launch agents by enabling or disabling them.
+
+    :param action: 'enable' or 'disable'
+    :type action: str
+    :param loaded: set of currently loaded agent labels (from loaded_agents);
+                   collected once here when omitted
+    :type loaded: set
+    """
+    # Resolve the handler once — an unknown action fails here, before any
+    # launchctl call, instead of after partial iterations
+    handler = _ACTION_HANDLERS.get(action)
+    if handler is None:
+        print(f"❌ Unknown action: {action}")
+        sys.exit(1)
 
-            print(f"✅ Enabling {launchctl_label}")
-            run_command(["launchctl", "bootstrap", f"gui/{UID}", plist_path])
+    if loaded is None:
+        loaded = loaded_agents()
 
-        else:
-            print(f"❌ Unknown action: {action}")
-            sys.exit(1)
+    for label, plist_path, launchctl_label in AGENTS:
+        handler(label, plist_path, launchctl_label, loaded)
 
 
 
@@ -101,7 +206,7 @@ def main():
 
     action = sys.argv[1]
     print(f"👤 Current user: {USERNAME}")
-    toggle_agents(action)
+    toggle_agents(action, loaded_agents())
 
 
 if __name__ == "__main__":
@@ -1,31 +1,67 @@
 #!/usr/bin/env python3
 
+import os
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import List, Optional
 
-from commons import log, notify
+from commons import log, notify, resolve_bin
 
 
+SUDO = resolve_bin("sudo", "/usr/bin/sudo")
+
+# resolve() so the path matches commons.BASE_DIR even when the script is
+# reached through a symlink — both must agree on where .work_mode lives.
+# It runs once at import, so the per-component stats are a one-off cost
 BASE_DIR = Path(__file__).resolve().parent
 WORK_MODE_FILE = BASE_DIR / ".work_mode"
 
 
 def notify_countdown(seconds: int) -> None:
     """
-    Send countdown notifications from N to 1.
+    Send countdown notifications at the salient marks (N, 5 and 1 seconds).
+
+    Sleeps through the gaps instead of waking and spawning a notification
+    subprocess every second — per-second updates add nothing the user can
+    act on.
 
     :param seconds: Number of seconds to count down from
     :type seconds: int
     """
-    for i in reversed(range(1, seconds + 1)):
+    marks = sorted({m for m in (seconds, 5, 1) if 1 <= m <= seconds}, reverse=True)
+    for mark, next_mark in zip(marks, marks[1:] + [0]):
         notify(
-            f"Blocking in {i} seconds",
+            f"Blocking in {mark} seconds",
             subtitle="Stop everything you're doing now!",
-            sound=(i == 1 or i == 10)
+            sound=(mark == 1 or mark >= 10)
         )
-        time.sleep(1)
+        time.sleep(mark - next_mark)
+
+
+def build_cmd(script: str, action: str) -> Optional[List[str]]:
+    """
+    Build the sudo command line for a script, or None when it should be skipped.
+
+    :param script: Script filename to run
+    :type script: str
+    :param action: Action to pass to the script ('block' or 'unblock')
+    :type action: str
+    :return: command list, or None if the script is skipped for this action
+    :rtype: List[str] or None
+    """
+    script_path = BASE_DIR / script
+    if script == "app_dropper.py":
+        if action == "block":
+            return [SUDO, str(script_path), "drop", "--yes"]
+        if action == "unblock":
+            log("Skipping app_dropper.py on 'unblock'")
+            return None
+        log(f"Unsupported action '{action}' for {script}")
+        return None
+    return [SUDO, str(script_path), action]
 
 
 def run_script(script: str, action: str) -> None:
@@ -39,30 +75,26 @@ def run_script(script: str, action: str) -> None:
     :raises SystemExit: exits if the subprocess returns a non-zero exit code
     """
     script_path = BASE_DIR / script
-    if not script_path.exists():
-        log(f"Script not found: {script_path}")
-        sys.exit(1)
-
     try:
-        # Construct command depending on script
-        if script == "app_dropper.py":
-            if action == "block":
-                cmd = ["sudo", str(script_path), "drop", "--yes"]
-            elif action == "unblock":
-                log("Skipping app_dropper.py on 'unblock'")
-                return
-            else:
-                log(f"Unsupported action '{action}' for {script}")
-                return
-        else:
-            cmd = ["sudo", str(script_path), action]
+        cmd = build_cmd(script, action)
+        if cmd is None:
+            return
 
         log(f"Running {script_path} with parameter(s): {' '.join(cmd[2:])}")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        log(f"{script} output:\n{result.stdout.strip()}")
-        if result.stderr.strip():
-            log(f"{script} errors:\n{result.stderr.strip()}")
-    except subprocess.CalledProcessError as e:
+        # Stream output line by line — logs surface live instead of after the
+        # child exits, and nothing is buffered in memory
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1, text=True
+        )
+        for line in proc.stdout:
+            line = line.rstrip()
+            if line:
+                log(f"{script}: {line}")
+        returncode = proc.wait()
+        if returncode != 0:
+            log(f"Error running {script}: exit code {returncode}")
+            sys.exit(1)
+    except OSError as e:
         log(f"Error running {script}: {e}")
         sys.exit(1)
 
@@ -89,6 +121,14 @@ def main():
 
     scripts = ["dir_blocker.py", "net_blocker.py", "app_dropper.py"]
 
+    # Fail fast on missing scripts with one directory read instead of a
+    # stat per script later on
+    present = {entry.name for entry in os.scandir(BASE_DIR) if entry.is_file()}
+    missing = [script for script in scripts if script not in present]
+    if missing:
+        log(f"Script(s) not found in {BASE_DIR}: {', '.join(missing)}")
+        sys.exit(1)
+
     warn_mode = '--warn' in sys.argv
 
     if action == "block" and warn_mode:
@@ -98,25 +138,48 @@ def main():
         time.sleep(50)
         notify_countdown(10)
 
-    # Set/reset lock file
-    # Set/reset lock file
+    # Set/reset lock file — EAFP, one syscall instead of an exists() stat first
     if action == "block":
-        if not WORK_MODE_FILE.exists():
-            WORK_MODE_FILE.touch()
+        try:
+            WORK_MODE_FILE.touch(exist_ok=False)
             log("Created .work_mode file — blocking work (not work time).")
-        else:
+        except FileExistsError:
             log(".work_mode file already exists — already blocked.")
             return  # Already blocked
     elif action == "unblock":
-        if WORK_MODE_FILE.exists():
+        try:
             WORK_MODE_FILE.unlink()
             log("Removed .work_mode file — work time is ON.")
-        else:
+        except FileNotFoundError:
             log(".work_mode file already absent — already unblocked.")
             return  # Already unblocked
 
-    for script in scripts:
-        run_script(script, action)
+    # Prime the sudo credential cache once, so the per-script sudo calls
+    # reuse it instead of re-running PAM auth each time. Done after the warn
+    # countdown — its ~5 minutes would otherwise outlive sudo's default
+    # timestamp_timeout and the cached credential would expire exactly as
+    # the blockers launch
+    try:
+        subprocess.run([SUDO, "-v"], check=True)
+    except subprocess.CalledProcessError as e:
+        log(f"Failed to prime sudo credentials: {e}")
+        sys.exit(1)
+
+    runnable = [script for script in scripts if build_cmd(script, action) is not None]
+
+    # The blockers are independent and I/O bound — run all but the last
+    # concurrently so interpreter startup and sudo overhead overlap
+    with ThreadPoolExecutor(max_workers=max(1, len(runnable) - 1)) as executor:
+        futures = [executor.submit(run_script, script, action) for script in runnable[:-1]]
+        for future in as_completed(futures):
+            future.result()
+
+    # Tail-exec the last script: replace this wrapper process instead of
+    # keeping it alive just to wait on one more child
+    if runnable:
+        last_cmd = build_cmd(runnable[-1], action)
+        log(f"Handing off to final script {runnable[-1]} with parameter(s): {' '.join(last_cmd[2:])}")
+        os.execvp(last_cmd[0], last_cmd)
 
     log(f"All scripts executed successfully with parameter '{action}'.")
 